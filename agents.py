@@ -1,18 +1,25 @@
 import os
 import json
-from openai import OpenAI
 
 class MultiAgentSystem:
     def __init__(self, vector_store):
-        # 使用 DashScope 的 OpenAI 兼容接口（通义千问）
-        self.client = OpenAI(
-            api_key=os.getenv("DASHSCOPE_API_KEY"),
-            base_url="https://dashscope.aliyuncs.com/compatible-mode/v1",
-        )
+        self._client = None
         # 聊天模型可通过环境变量覆盖，默认使用 qwen-plus
         self.chat_model = os.getenv("QWEN_CHAT_MODEL", "qwen-plus")
         self.vector_store = vector_store
 
+    @property
+    def client(self):
+        """首次调用时才导入 openai 并创建客户端"""
+        if self._client is None:
+            from openai import OpenAI
+            # 使用 DashScope 的 OpenAI 兼容接口（通义千问）
+            self._client = OpenAI(
+                api_key=os.getenv("DASHSCOPE_API_KEY"),
+                base_url="https://dashscope.aliyuncs.com/compatible-mode/v1",
+            )
+        return self._client
+
     def _chat(self, messages):
         completion = self.client.chat.completions.create(
             model=self.chat_model,
@@ -0,0 +1,16 @@
+import os
+
+# 仅依赖标准库，供 CLI 在不加载流水线的情况下判断构建缓存是否有效
+
+def get_output_path(db_path):
+    """根据数据库文件名推导输出的 TTL 路径"""
+    db_filename = os.path.basename(db_path)
+    ttl_filename = os.path.splitext(db_filename)[0] + ".ttl"
+    return os.path.join("data", "ttl", ttl_filename)
+
+def is_up_to_date(output_path, input_paths):
+    """输出文件存在且不早于所有输入文件时视为已缓存"""
+    if not os.path.exists(output_path):
+        return False
+    output_mtime = os.path.getmtime(output_path)
+    return all(os.path.exists(p) and os.path.getmtime(p) <= output_mtime for p in input_paths)
@@ -1,5 +1,4 @@
 import sqlite3
-import pandas as pd
 import json
 import os
 
@@ -22,6 +21,8 @@ class SpiderDataLoader:
 
     def generate_table_fingerprint(self, table_name, k_samples=5):
         """生成表的语义指纹：包含列名、类型、统计信息和样本数据"""
+        import pandas as pd
+
         try:
             df = pd.read_sql_query(f"SELECT * FROM `{table_name}`", self.conn)
         except Exception as e:
@@ -53,6 +54,8 @@ class SpiderDataLoader:
 
     def get_dataframe(self, table_name):
         """获取完整的 DataFrame，用于后续图谱生成"""
+        import pandas as pd
+
         return pd.read_sql_query(f"SELECT * FROM `{table_name}`", self.conn)
 
     def close(self):
@@ -1,4 +1,3 @@
-import pandas as pd
 import os
 from dataloader import SpiderDataLoader
 from schema_parser import parse_schema_org
@@ -79,6 +78,7 @@ def generate_draft(spider_dir, schema_file, target_databases):
         loader.close()
     
     # 保存为 CSV
+    import pandas as pd
     df = pd.DataFrame(draft_data)
 
 
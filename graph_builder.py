@@ -1,10 +1,11 @@
-from rdflib import Graph, URIRef, Literal, RDF, Namespace
 import urllib.parse
-import pandas as pd
 import re
 
 class RDFGraphBuilder:
     def __init__(self):
+        # rdflib 导入较慢，推迟到真正构建图谱时再加载
+        from rdflib import Graph, Namespace
+
         self.g = Graph()
         self.SCHEMA = Namespace("http://schema.org/")
         self.g.bind("schema", self.SCHEMA)
@@ -23,6 +24,9 @@ class RDFGraphBuilder:
         将 DataFrame 的每一行转换为 RDF 子图。
         通用化 URI 构建，并增加了防御性代码以确保复合主键的正确性。
         """
+        from rdflib import URIRef, Literal, RDF
+        import pandas as pd
+
         print(f"🔨 正在为表 '{table_name}' 生成图谱 (包含关系链接)...")
         
         fk_set = set(foreign_keys or [])
@@ -1,43 +1,46 @@
-from rdflib_neo4j import Neo4jStoreConfig, Neo4jStore
-from rdflib import Graph
 import os
+import sys
 import argparse
 
-# --- 1. 设置命令行参数解析 ---
-parser = argparse.ArgumentParser(description="Import an RDF TTL file into Neo4j Aura.")
-parser.add_argument("ttl_file", type=str, help="Path to the .ttl file to import.")
-args = parser.parse_args()
-ttl_file_path = args.ttl_file
-
 # 推荐：从 .env 文件加载凭据
 # from dotenv import load_dotenv
 # load_dotenv()
 
-# 配置 Aura 连接信息
-auth_data = {
-    'uri': os.getenv("NEO4J_URI", "neo4j+s://a1b9c584.databases.neo4j.io"),
-    'database': os.getenv("NEO4J_DATABASE", "neo4j"),
-    'user': os.getenv("NEO4J_USER", "neo4j"),
-    'pwd': os.getenv("NEO4J_PWD", "SpTPDLpQmXojFcQewQdLYQr4LwoSyFbZs0H3iXR8z_I")
-}
-
-if not all(auth_data.values()):
-    raise ValueError("Neo4j 连接信息不完整，请检查环境变量或代码中的硬编码值。")
-
-config = Neo4jStoreConfig(auth_data=auth_data)
-graph = Graph(store=Neo4jStore(config=config))
-
-# --- 2. 使用从命令行获取的文件路径 ---
-print(f"准备从 '{ttl_file_path}' 解析三元组...")
-if not os.path.exists(ttl_file_path):
-    print(f"错误：文件 '{ttl_file_path}' 未找到。请检查文件路径是否正确。")
-else:
+def get_auth_data():
+    """配置 Aura 连接信息"""
+    return {
+        'uri': os.getenv("NEO4J_URI", "neo4j+s://a1b9c584.databases.neo4j.io"),
+        'database': os.getenv("NEO4J_DATABASE", "neo4j"),
+        'user': os.getenv("NEO4J_USER", "neo4j"),
+        'pwd': os.getenv("NEO4J_PWD", "SpTPDLpQmXojFcQewQdLYQr4LwoSyFbZs0H3iXR8z_I")
+    }
+
+def import_ttl(ttl_file_path, batch_size=100):
+    """将 TTL 文件中的三元组分批导入 Neo4j Aura，成功返回 0，失败返回 1"""
+    if batch_size < 1:
+        raise ValueError(f"batch_size 必须大于等于 1，当前为 {batch_size}")
+
+    auth_data = get_auth_data()
+    if not all(auth_data.values()):
+        raise ValueError("Neo4j 连接信息不完整，请检查环境变量或代码中的硬编码值。")
+
+    print(f"准备从 '{ttl_file_path}' 解析三元组...")
+    if not os.path.exists(ttl_file_path):
+        print(f"错误：文件 '{ttl_file_path}' 未找到。请检查文件路径是否正确。")
+        return 1
+
+    # rdflib / rdflib-neo4j 导入较慢，确认文件存在后再加载
+    from rdflib import Graph
+    from rdflib_neo4j import Neo4jStoreConfig, Neo4jStore
+
+    config = Neo4jStoreConfig(auth_data=auth_data)
+    graph = Graph(store=Neo4jStore(config=config))
+
     local_g = Graph()
     local_g.parse(ttl_file_path, format="turtle")
 
     print(f"解析完成，共找到 {len(local_g)} 个三元组。现在开始分批导入...")
 
-    batch_size = 100
     triples = list(local_g)
     imported_count = 0
 
@@ -58,3 +61,12 @@ else:
 
     print("导入完成！")
     graph.close()
+    return 0 if imported_count == len(triples) else 1
+
+if __name__ == "__main__":
+    # --- 设置命令行参数解析 ---
+    parser = argparse.ArgumentParser(description="Import an RDF TTL file into Neo4j Aura.")
+    parser.add_argument("ttl_file", type=str, help="Path to the .ttl file to import.")
+    args = parser.parse_args()
+
+    sys.exit(import_ttl(args.ttl_file))
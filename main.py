@@ -1,4 +1,5 @@
 import os
+import sys
 import argparse
 from dotenv import load_dotenv
 from dataloader import SpiderDataLoader
@@ -6,15 +7,22 @@ from schema_parser import parse_schema_org
 from vector_store import OntologyVectorStore
 from agents import MultiAgentSystem
 from graph_builder import RDFGraphBuilder
+from build_cache import get_output_path, is_up_to_date
 
 # 加载环境变量
 load_dotenv()
 
-def main(db_path, schema_file):
+def main(db_path, schema_file, force=False):
     # 配置路径现在通过函数参数传入
     DB_PATH = db_path
     SCHEMA_FILE = schema_file
-    
+    output_path = get_output_path(DB_PATH)
+
+    # 增量构建：图谱已是最新则直接返回，不加载向量库和大模型客户端
+    if not force and is_up_to_date(output_path, [DB_PATH, SCHEMA_FILE]):
+        print(f"✅ 知识图谱已是最新，跳过构建: {output_path}")
+        return 0
+
     print("=== Step 1: 初始化系统 ===")
     # 1. 准备向量库
     kg_store = OntologyVectorStore()
@@ -23,7 +31,7 @@ def main(db_path, schema_file):
     if need_build:
         if not os.path.exists(SCHEMA_FILE):
             print(f"⚠️ 未找到本体文件: {SCHEMA_FILE}，无法构建向量索引。")
-            return
+            return 1
         terms = parse_schema_org(SCHEMA_FILE)
         kg_store.create_or_load_index(terms)
     else:
@@ -34,7 +42,7 @@ def main(db_path, schema_file):
         loader = SpiderDataLoader(DB_PATH)
     except FileNotFoundError:
         print(f"⚠️ 未找到数据库文件: {DB_PATH}，跳过执行。")
-        return
+        return 1
 
     agent_system = MultiAgentSystem(kg_store)
     graph_builder = RDFGraphBuilder()
@@ -66,17 +74,16 @@ def main(db_path, schema_file):
     loader.close()
 
     print("\n=== Step 3: 导出知识图谱 ===")
-    db_filename = os.path.basename(DB_PATH)
-    ttl_filename = os.path.splitext(db_filename)[0] + ".ttl"
-    output_path = os.path.join("data", "ttl", ttl_filename)
     graph_builder.save_graph(output_path)
+    return 0
 
 if __name__ == "__main__":
     # --- 设置命令行参数解析 ---
     parser = argparse.ArgumentParser(description="Generate a Knowledge Graph from a SQLite database and a Schema.org ontology.")
     parser.add_argument("db_path", type=str, help="Path to the input SQLite database file.")
     parser.add_argument("schema_file", type=str, help="Path to the Schema.org JSON-LD file.")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the output TTL is newer than the database and schema file (needed after code or prompt changes).")
     args = parser.parse_args()
 
     # 使用从命令行解析的参数调用 main 函数
-    main(args.db_path, args.schema_file)
+    sys.exit(main(args.db_path, args.schema_file, force=args.force))
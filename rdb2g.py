@@ -0,0 +1,177 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+# 顶层只导入标准库；各子命令的实现模块在执行时才加载，保证 --help 等路径冷启动足够快
+
+DEFAULT_SCHEMA_FILE = "data/schemaorg.jsonld"
+DEFAULT_SPIDER_DIR = "data/spider_data/database"
+
+# 这些依赖导入耗时以秒计，不应在 CLI 启动阶段被加载
+HEAVY_MODULES = ("pandas", "rdflib", "rdflib_neo4j", "openai", "chromadb", "langchain_chroma", "langchain_core")
+PIPELINE_MODULES = ("main", "generate_ground_truth", "import_aura", "vector_store", "agents", "dataloader", "graph_builder", "schema_parser", "build_cache")
+
+
+def cmd_build(args):
+    from main import main
+    return main(args.db_path, args.schema_file, force=args.force)
+
+
+def cmd_draft(args):
+    from generate_ground_truth import generate_draft
+    generate_draft(args.spider_dir, args.schema_file, args.databases)
+
+
+def cmd_import(args):
+    from import_aura import import_ttl
+    return import_ttl(args.ttl_file, batch_size=args.batch_size)
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return number
+
+
+def _time_command(argv, runs):
+    """以子进程方式运行命令，返回每次的耗时（毫秒）以及首个非零返回码"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False)
+        timings.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            # 失败的命令耗时没有意义，直接返回错误信息
+            lines = result.stderr.strip().splitlines()
+            return timings, result.returncode, lines[-1] if lines else ""
+    return timings, 0, ""
+
+
+def _check_heavy_imports(runs):
+    """多次在新进程中导入全部流水线模块，返回 (耗时列表, 提前加载的重依赖, 导入失败的模块)"""
+    code = (
+        "import sys, json\n"
+        "failed = {}\n"
+        f"for name in {PIPELINE_MODULES!r}:\n"
+        "    try:\n"
+        "        __import__(name)\n"
+        "    except BaseException as e:\n"
+        "        failed[name] = f'{type(e).__name__}: {e}'\n"
+        f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'loaded': loaded, 'failed': failed}))\n"
+    )
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=False,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        timings.append((time.perf_counter() - start) * 1000)
+        try:
+            report = json.loads(result.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            report = None
+        if result.returncode != 0 or report is None:
+            lines = result.stderr.strip().splitlines()
+            detail = lines[-1] if lines else f"exit code {result.returncode}"
+            return timings, [], {"<subprocess>": detail}
+        if report["loaded"] or report["failed"]:
+            break
+    return timings, report["loaded"], report["failed"]
+
+
+def cmd_bench(args):
+    from build_cache import get_output_path, is_up_to_date
+
+    script = os.path.abspath(__file__)
+    failed = False
+    cases = [("--help", [sys.executable, script, "--help"])]
+    for sub in ("build", "draft", "import"):
+        cases.append((f"{sub} --help", [sys.executable, script, sub, "--help"]))
+    if args.db_path:
+        # 只测量已缓存的增量构建；缓存失效时运行会触发完整的大模型调用，必须拒绝
+        output_path = get_output_path(args.db_path)
+        if is_up_to_date(output_path, [args.db_path, args.schema_file]):
+            cases.append((f"build {args.db_path} (cached)", [sys.executable, script, "build", args.db_path, args.schema_file]))
+        else:
+            print(f"⚠️ {output_path} 不存在或早于 {args.db_path} / {args.schema_file}，跳过缓存构建测量。")
+            failed = True
+
+    print(f"冷启动耗时（{args.runs} 次，预算 {args.budget_ms:.0f} ms）:")
+    results = []
+    for label, argv in cases:
+        timings, returncode, error = _time_command(argv, args.runs)
+        results.append((label, timings, returncode, error))
+
+    # 导入全部流水线模块的耗时，即未指定 --db-path 时缓存构建启动成本的下限
+    timings, heavy, import_failures = _check_heavy_imports(args.runs)
+    if import_failures:
+        results.append(("import pipeline modules", timings, 1, f"{len(import_failures)} 个模块导入失败"))
+    else:
+        results.append(("import pipeline modules", timings, 0, ""))
+
+    for label, timings, returncode, error in results:
+        if returncode != 0:
+            failed = True
+            print(f"  FAILED {label:<40} exit code {returncode}: {error}")
+            continue
+        median = statistics.median(timings)
+        status = "OK" if median <= args.budget_ms else "SLOW"
+        failed = failed or median > args.budget_ms
+        print(f"  {status:6} {label:<40} median {median:7.1f} ms  min {min(timings):7.1f} ms")
+
+    if not args.db_path:
+        print("ℹ️ 未指定 --db-path，未测量缓存构建本身；上面的 import pipeline modules 为其导入开销。")
+
+    for name, error in import_failures.items():
+        print(f"❌ 无法导入 {name}: {error}")
+    if heavy:
+        print(f"⚠️ 导入流水线模块时提前加载了重依赖: {', '.join(heavy)}")
+    elif not import_failures:
+        print("✅ 导入流水线模块时未加载任何重依赖。")
+
+    return 1 if failed or heavy or import_failures else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="rdb2g", description="Relational database to knowledge graph pipeline.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="Generate a Knowledge Graph from a SQLite database and a Schema.org ontology.")
+    build.add_argument("db_path", type=str, help="Path to the input SQLite database file.")
+    build.add_argument("schema_file", type=str, nargs="?", default=DEFAULT_SCHEMA_FILE, help="Path to the Schema.org JSON-LD file.")
+    build.add_argument("--force", action="store_true", help="Rebuild even if the output TTL is newer than the database and schema file (needed after code or prompt changes).")
+    build.set_defaults(func=cmd_build)
+
+    draft = subparsers.add_parser("draft", help="Generate a ground-truth draft CSV for Spider databases.")
+    draft.add_argument("databases", nargs="+", help="Names of the Spider databases to process.")
+    draft.add_argument("--spider-dir", type=str, default=DEFAULT_SPIDER_DIR, help="Path to the Spider database directory.")
+    draft.add_argument("--schema-file", type=str, default=DEFAULT_SCHEMA_FILE, help="Path to the Schema.org JSON-LD file.")
+    draft.set_defaults(func=cmd_draft)
+
+    import_ = subparsers.add_parser("import", help="Import an RDF TTL file into Neo4j Aura.")
+    import_.add_argument("ttl_file", type=str, help="Path to the .ttl file to import.")
+    import_.add_argument("--batch-size", type=_positive_int, default=100, help="Number of triples per commit.")
+    import_.set_defaults(func=cmd_import)
+
+    bench = subparsers.add_parser("bench", help="Measure CLI cold-start time and check for eagerly loaded dependencies.")
+    bench.add_argument("--runs", type=_positive_int, default=5, help="Number of runs per command.")
+    bench.add_argument("--budget-ms", type=float, default=300.0, help="Maximum acceptable median start-up time in milliseconds.")
+    bench.add_argument("--db-path", type=str, default=None, help="Also time a cached build of this SQLite database.")
+    bench.add_argument("--schema-file", type=str, default=DEFAULT_SCHEMA_FILE, help="Schema.org JSON-LD file used for the cached build.")
+    bench.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,5 @@
 import os
-# 优先使用新包 langchain-chroma，若未安装则回退到社区版
-
-from langchain_chroma import Chroma
-
-from langchain_core.documents import Document
-from openai import OpenAI
+# langchain-chroma / chromadb / openai 导入开销很大，统一推迟到首次使用时再加载
 
 class QwenEmbeddings:
     """使用 DashScope 的 OpenAI 兼容接口实现的最小 Embeddings 适配器，
@@ -13,10 +8,17 @@ class QwenEmbeddings:
     """
     def __init__(self, model: str | None = None, api_key: str | None = None, base_url: str | None = None):
         self.model = model or os.getenv("QWEN_EMBEDDING_MODEL")
-        self.client = OpenAI(
-            api_key=api_key or os.getenv("DASHSCOPE_API_KEY"),
-            base_url=base_url or os.getenv("OPENAI_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1"),
-        )
+        self.api_key = api_key or os.getenv("DASHSCOPE_API_KEY")
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1")
+        self._client = None
+
+    @property
+    def client(self):
+        """首次调用嵌入接口时才创建 OpenAI 客户端"""
+        if self._client is None:
+            from openai import OpenAI
+            self._client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        return self._client
 
     def embed_query(self, text: str):
         if text is None:
@@ -46,6 +48,8 @@ class OntologyVectorStore:
 
     def create_or_load_index(self, schema_terms=None):
         """如果本地存在索引则加载，否则新建"""
+        from langchain_chroma import Chroma
+
         if os.path.exists(self.persist_dir) and os.listdir(self.persist_dir):
             print("加载本地向量索引...")
             self.vector_db = Chroma(persist_directory=self.persist_dir, embedding_function=self.embedding_fn)
@@ -53,6 +57,7 @@ class OntologyVectorStore:
             if not schema_terms:
                 raise ValueError("本地索引不存在，且未提供 schema_terms 用于构建！")
             print("构建新向量索引...")
+            from langchain_core.documents import Document
             docs = []
             for term in schema_terms:
                 # 构造富语义文本：把 Schema.org 术语的核心字段拼接为文档